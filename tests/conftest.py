@@ -0,0 +1,105 @@
+"""
+Shared fixtures for the Actions Vocabulary test suite.
+"""
+
+import hashlib
+import os
+import pickle
+from pathlib import Path
+
+import pytest
+import rdflib
+from rdflib import Graph
+
+
+ONTOLOGY_DIR = Path(__file__).parent.parent
+SHAPES_FILE = ONTOLOGY_DIR / "v4" / "actions-shapes-v4.ttl"
+ONTOLOGY_FILE = ONTOLOGY_DIR / "v4" / "actions-vocabulary.owl"
+
+
+@pytest.fixture(scope="session")
+def graph_loader(request):
+    """Return load(path, format) -> Graph backed by an on-disk pickle cache.
+
+    Parsed graphs are pickled under pytest's cache directory, keyed by the
+    source file's SHA-256 and the rdflib version, so later sessions skip
+    rdflib's parsers even after a fresh checkout resets mtimes (e.g. a CI
+    job restoring .pytest_cache). A missing cache provider or unreadable
+    cache entry falls back to parsing.
+    """
+    cache = getattr(request.config, "cache", None)
+    cache_dir = cache.mkdir("rdf-graphs") if cache is not None else None
+
+    def load(path: Path, fmt: str) -> Graph:
+        # A JSON-LD graph also depends on its @context document, which the
+        # key below does not cover
+        if cache_dir is None or fmt == "json-ld":
+            return Graph().parse(path, format=fmt)
+
+        digest = hashlib.sha256(path.read_bytes()).hexdigest()[:16]
+        prefix = f"{path.name}.{fmt}."
+        cached = cache_dir / f"{prefix}{rdflib.__version__}-{digest}.pickle"
+        if cached.exists():
+            try:
+                with cached.open("rb") as f:
+                    return pickle.load(f)
+            except Exception:
+                pass
+
+        graph = Graph().parse(path, format=fmt)
+        for stale in cache_dir.glob(f"{prefix}*.pickle"):
+            stale.unlink(missing_ok=True)
+        # Write then rename so concurrent sessions never read a partial file
+        tmp = cached.with_suffix(f".{os.getpid()}.tmp")
+        with tmp.open("wb") as f:
+            pickle.dump(graph, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp, cached)
+        return graph
+
+    return load
+
+
+@pytest.fixture(scope="session")
+def data_loader(graph_loader):
+    """Return load(path, format) -> Graph, parsing each example at most once.
+
+    Tests that hit the same file share one Graph object, so callers must
+    treat it as read-only.
+    """
+    graphs = {}
+
+    def load(path: Path, fmt: str) -> Graph:
+        key = (path, fmt)
+        if key not in graphs:
+            graphs[key] = graph_loader(path, fmt)
+        return graphs[key]
+
+    return load
+
+
+@pytest.fixture(scope="session")
+def shacl_validator(graph_loader):
+    """Return run(data_graph) -> (conforms, results_graph, results_text).
+
+    The v4 shapes and ontology graphs are loaded once per session and bound
+    into the returned callable, so every test validates against the same
+    objects. RDFS inference runs per call over data and ontology together:
+    domain/range typing and subPropertyOf entailments depend on the data.
+    """
+    # pyshacl pulls in owlrl and friends; only pay for that when a test
+    # actually validates, not on --collect-only or -k subsets.
+    from pyshacl import validate
+
+    shapes_graph = graph_loader(SHAPES_FILE, "turtle")
+    ontology_graph = graph_loader(ONTOLOGY_FILE, "xml")
+
+    def run(data_graph: Graph):
+        return validate(
+            data_graph,
+            shacl_graph=shapes_graph,
+            ont_graph=ontology_graph,
+            inference="rdfs",
+            abort_on_first=False,
+        )
+
+    return run
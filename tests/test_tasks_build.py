@@ -0,0 +1,100 @@
+"""Test the incremental site build helpers in tasks.py."""
+
+import importlib.util
+import os
+from pathlib import Path
+
+import pytest
+import rdflib
+
+ONTOLOGY_DIR = Path(__file__).parent.parent
+
+SOURCE_OWL = """<?xml version="1.0"?>
+<rdf:RDF xmlns:rdf="http://www.w3.org/1999/02/22-rdf-syntax-ns#"
+         xmlns:owl="http://www.w3.org/2002/07/owl#"
+         xmlns:rdfs="http://www.w3.org/2000/01/rdf-schema#">
+  <owl:Class rdf:about="https://example.org/vocab#Thing">
+    <rdfs:label>Thing</rdfs:label>
+  </owl:Class>
+</rdf:RDF>
+"""
+
+
+@pytest.fixture
+def tasks(tmp_path, monkeypatch):
+    """tasks.py loaded as a module, with the working directory in a scratch tree."""
+    spec = importlib.util.spec_from_file_location("tasks", ONTOLOGY_DIR / "tasks.py")
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    monkeypatch.chdir(tmp_path)
+    Path("vocab.owl").write_text(SOURCE_OWL, encoding="utf-8")
+    Path("out").mkdir()
+    return module
+
+
+def outputs(tasks) -> list[Path]:
+    return [Path(dst) for _, dst in tasks._rdf_outputs("out", "vocab")]
+
+
+def age_outputs(tasks) -> None:
+    """Make every output older than the source, as a fresh checkout would."""
+    mtime = os.path.getmtime("vocab.owl") - 10
+    for path in outputs(tasks):
+        os.utime(path, (mtime, mtime))
+
+
+def test_prune_stale_keeps_produced_files(tasks):
+    for path in ("site/index.html", "site/old.html", "site/gone/page.html"):
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        Path(path).write_text("x")
+    Path("site/empty").mkdir()
+
+    removed = tasks._prune_stale("site", {"site/index.html"})
+
+    assert sorted(removed) == [
+        str(Path("site/gone/page.html")),
+        str(Path("site/old.html")),
+    ]
+    assert Path("site/index.html").exists()
+    assert not Path("site/gone").exists()
+    assert not Path("site/empty").exists()
+
+
+def test_emit_formats_current_restored_built(tasks):
+    assert tasks._emit_formats("vocab.owl", "out", "vocab") == "built"
+    assert all(path.exists() for path in outputs(tasks))
+    assert tasks._emit_formats("vocab.owl", "out", "vocab") == "current"
+
+    age_outputs(tasks)
+    assert tasks._emit_formats("vocab.owl", "out", "vocab") == "restored"
+    assert tasks._emit_formats("vocab.owl", "out", "vocab") == "current"
+
+    tasks.shutil.rmtree(tasks.BUILD_CACHE_DIR)
+    age_outputs(tasks)
+    assert tasks._emit_formats("vocab.owl", "out", "vocab") == "built"
+
+    graph = rdflib.Graph().parse("out/vocab.ttl", format="turtle")
+    assert (None, rdflib.RDFS.label, rdflib.Literal("Thing")) in graph
+
+
+def test_failed_serializer_leaves_previous_outputs(tasks, monkeypatch):
+    tasks._emit_formats("vocab.owl", "out", "vocab")
+    before = {path: path.read_bytes() for path in outputs(tasks)}
+
+    tasks.shutil.rmtree(tasks.BUILD_CACHE_DIR)
+    age_outputs(tasks)
+    serialize = rdflib.Graph.serialize
+
+    def failing_serialize(self, destination=None, format="turtle", **kwargs):
+        if format == "nt":
+            destination.write(b"partial")
+            raise RuntimeError("serializer failed")
+        return serialize(self, destination=destination, format=format, **kwargs)
+
+    monkeypatch.setattr(rdflib.Graph, "serialize", failing_serialize)
+    with pytest.raises(RuntimeError, match="serializer failed"):
+        tasks._emit_formats("vocab.owl", "out", "vocab")
+
+    assert {path: path.read_bytes() for path in outputs(tasks)} == before
+    assert not list(Path("out").glob("*.tmp"))
+    assert not tasks.BUILD_CACHE_DIR.exists()
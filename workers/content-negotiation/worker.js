@@ -43,6 +43,8 @@ function handleVersionNegotiation(version, accept) {
     targetPath = `/vocab/actions/${version}/actions-vocabulary.owl`;
   } else if (accept.includes('text/turtle')) {
     targetPath = `/vocab/actions/${version}/actions-vocabulary.ttl`;
+  } else if (accept.includes('application/n-triples')) {
+    targetPath = `/vocab/actions/${version}/actions-vocabulary.nt`;
   } else if (accept.includes('application/ld+json')) {
     targetPath = `/vocab/actions/${version}/actions-vocabulary.jsonld`;
   } else if (accept.includes('application/json')) {
@@ -66,6 +68,8 @@ function handleWorkspaceNegotiation(accept) {
     targetPath = '/vocab/workspace/v1/workspace-vocabulary.owl';
   } else if (accept.includes('text/turtle')) {
     targetPath = '/vocab/workspace/v1/workspace-vocabulary.ttl';
+  } else if (accept.includes('application/n-triples')) {
+    targetPath = '/vocab/workspace/v1/workspace-vocabulary.nt';
   } else if (accept.includes('application/ld+json') || accept.includes('application/json')) {
     targetPath = '/vocab/workspace/v1/workspace-vocabulary.jsonld';
   } else if (accept.includes('text/html')) {